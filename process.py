@@ -12,18 +12,38 @@ optional full-data output, slicing indices, interpolation, plotting, and summary
 """
 import os
 import shutil
+import multiprocessing
 import numpy as np
-from scipy import interpolate
+from scipy import ndimage
+import matplotlib
+matplotlib.use('Agg')                 # Headless rendering for batch jobs
 import matplotlib.pyplot as plt
+plt.rcParams.update({'path.simplify': True,
+                     'path.simplify_threshold': 1.0,
+                     'agg.path.chunksize': 10000})
+
+try:
+    import numba                      # Optional: JIT-compiled chunk scatter
+except ImportError:
+    numba = None
+
+try:
+    import pandas as pd               # Optional: C tokenizer for chunk files
+except ImportError:
+    pd = None
 
 ################# USER CONFIG ##################
 BASE_DIR        = 'tasks'             # Root directory containing task_* subfolders
 TIME_STEP       = 500                   # Base index for the first data chunk
 NUM_CHUNKS      = 20                  # Number of chunk files per time step
 DAT_PATTERN     = 'PELOOP.%08d.dat'   # Filename pattern for chunk data (index = TIME_STEP + chunk)
+READ_BLOCK_ROWS = 1_000_000           # Rows parsed per block when reading chunk files with pandas
+WRITE_BLOCK_ROWS = 100_000            # Rows formatted per block when writing ASCII output
 
 # Toggle full 3D data output
 WRITE_PXYZ      = False               # Set to False to skip writing full 3D data file
+LEGACY_ASCII    = False               # True writes full 3D data as ASCII text instead of binary .npy
+WRITE_SLICE_DAT = False               # True also writes XY.dat/XZ.dat/YZ.dat slice files for external tools
 
 # Slicing indices (1-based). None selects the mid-plane dimension.
 XY_SLICE_K      = 150                 # Z-index for XY slice
@@ -56,8 +76,15 @@ YZ_Z_MIN, YZ_Z_MAX = 25, 165          # Z-axis domain limits
 YZ_COLOR        = 'blue'              # Quiver arrow color
 YZ_SCALE_FACTOR = 0.757               # Scaling factor applied to vector components
 
+NUM_WORKERS     = None                # Worker processes for parallel task processing (None = all CPUs)
+MAX_TASKS_PER_CHILD = None            # Recycle workers after this many tasks (None = never; keeps
+                                      # the per-process grid buffer, Figure and Numba code for reuse)
+
+QUIVER_MIN_REL_MAG = 1e-6             # Skip arrows shorter than this fraction of the longest arrow
+
 OUTPUT_EXT      = 'jpg'               # Image file extension for plots
-PXYZ_FILENAME   = 'pxyz.in'           # Filename for full 3D data output
+PXYZ_FILENAME   = 'pxyz.in'           # Filename for full 3D data output (ASCII, LEGACY_ASCII only)
+PXYZ_NPY_FILENAME = 'pxyz.npy'        # Filename for full 3D data output (binary, shape (3, nx, ny, nz))
 #################################################
 
 ################# SUMMARY CONFIG ##################
@@ -75,8 +102,17 @@ PLANE_CSV = {
     'XZ': os.path.join(PLANE_DIRS['XZ'], 'XZ_summary.csv'),
     'YZ': os.path.join(PLANE_DIRS['YZ'], 'YZ_summary.csv'),
 }
+# Hardlink plots into summary directories instead of copying (falls back to a copy
+# across filesystems). Linked files share data with the task folder's plot, so
+# editing one in place changes the other.
+SUMMARY_USE_HARDLINK = True
 ###################################################
 
+# Figure and Axes reused across plots within a process (see get_plot_axes)
+_FIG = _AX = None
+# (3, nx, ny, nz) polarization array reused across tasks within a process (see get_grid_buffer)
+_GRID = None
+
 def ensure_summary_setup():
     """
     Create summary directories and initialize CSV files with headers if not present.
@@ -108,9 +144,14 @@ def parse_task_info(folder_name):
     return task_id, ';'.join(pairs)
 
 
-def summarize_plots(folder, folder_name):
+def summarize_plots(folder, folder_name, csv_handles):
     """
-    Copy generated quiver plots to summary directories and append entries to CSVs.
+    Link (or copy) generated quiver plots to summary directories and append entries to CSVs.
+
+    Parameters:
+        folder (str): Path to the task directory containing the plots.
+        folder_name (str): Task folder name, parsed for task ID and parameters.
+        csv_handles (dict): Open append-mode file objects keyed by plane.
     """
     task_id, param_str = parse_task_info(folder_name)
     for plane in ('XY', 'XZ', 'YZ'):
@@ -118,30 +159,138 @@ def summarize_plots(folder, folder_name):
         if os.path.isfile(src):
             dst_name = f"{folder_name}_{plane}.{OUTPUT_EXT}"
             dst = os.path.join(PLANE_DIRS[plane], dst_name)
-            shutil.copy2(src, dst)
-            with open(PLANE_CSV[plane], 'a') as f:
-                f.write(f"{task_id},{param_str},{dst_name}\n")
+            if os.path.lexists(dst):
+                os.remove(dst)
+            if SUMMARY_USE_HARDLINK:
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
+            else:
+                shutil.copy2(src, dst)
+            csv_handles[plane].write(f"{task_id},{param_str},{dst_name}\n")
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def scatter_chunk(data, P):
+        """
+        Scatter chunk rows (i, j, k, px, py, pz; 1-based indices) into the
+        (3, nx, ny, nz) array P in a single compiled pass over the rows.
+        Serial on purpose: pool workers already use every CPU, and rows repeating
+        an (i, j, k) keep the last value as the original parser did.
+        Indices are not bounds-checked here; slice_data validates them first.
+        """
+        for r in range(data.shape[0]):
+            i = int(data[r, 0]) - 1
+            j = int(data[r, 1]) - 1
+            k = int(data[r, 2]) - 1
+            P[0, i, j, k] = data[r, 3]
+            P[1, i, j, k] = data[r, 4]
+            P[2, i, j, k] = data[r, 5]
+else:
+    def scatter_chunk(data, P):
+        """
+        Scatter chunk rows (i, j, k, px, py, pz; 1-based indices) into the
+        (3, nx, ny, nz) array P with one NumPy fancy-index assignment
+        (fallback when numba is unavailable).
+        """
+        i = data[:, 0].astype(np.intp) - 1
+        j = data[:, 1].astype(np.intp) - 1
+        k = data[:, 2].astype(np.intp) - 1
+        P[:, i, j, k] = data[:, 3:6].T
+
+
+def read_chunk_rows(fpath):
+    """
+    Parse the data lines (columns i, j, k, px, py, pz) of a chunk file after its header.
+
+    Uses pandas' C tokenizer in blocks of READ_BLOCK_ROWS rows to bound memory, or a
+    single np.loadtxt call when pandas is unavailable. Either way, rows with fewer
+    than six fields or with NaN values are dropped.
+
+    Yields:
+        data (ndarray): float64 array of shape (rows, 6) per block.
+
+    Raises:
+        ValueError: If the file contains non-numeric data.
+    """
+    if pd is None:
+        with open(fpath) as f:
+            next(f, None)
+            rows = [line for line in f if len(line.split()) >= 6]
+        if not rows:
+            yield np.empty((0, 6))
+            return
+        data = np.loadtxt(rows, usecols=range(6), ndmin=2)
+        yield data[~np.isnan(data).any(axis=1)]
+        return
+    reader = pd.read_csv(fpath, sep=r'\s+', engine='c', header=None, skiprows=1,
+                         names=range(6), usecols=range(6), dtype=np.float64,
+                         chunksize=READ_BLOCK_ROWS)
+    with reader:
+        for df in reader:
+            yield df.dropna().to_numpy()
+
+
+def write_columns(path, arr, fmt, header=None):
+    """
+    Write a 2D array as whitespace-separated ASCII columns (same output as np.savetxt).
+
+    Each block of WRITE_BLOCK_ROWS rows is formatted with a single %-operation on a
+    repeated row template instead of one format call per row.
+
+    Parameters:
+        path (str): Output file path.
+        arr (ndarray): 2D array, one output row per array row.
+        fmt (list of str): One %-format per column.
+        header (str): Optional first line written as-is.
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    row = ' '.join(fmt) + '\n'
+    with open(path, 'w') as f:
+        if header is not None:
+            f.write(header + '\n')
+        for start in range(0, arr.shape[0], WRITE_BLOCK_ROWS):
+            block = arr[start:start + WRITE_BLOCK_ROWS]
+            f.write((row * block.shape[0]) % tuple(block.ravel().tolist()))
+
+
+def get_grid_buffer(shape):
+    """
+    Return this process's zeroed (3, nx, ny, nz) array holding px, py, pz for the grid
+    shape (nx, ny, nz). It is reallocated only when the shape differs from the previous task.
+    """
+    global _GRID
+    if _GRID is None or _GRID.shape[1:] != shape:
+        _GRID = np.empty((3,) + shape)
+    _GRID.fill(0.0)
+    return _GRID
 
 
 def slice_data(folder):
     """
-    Aggregate 3D data from multiple chunk files and write slice data.
+    Aggregate 3D data from multiple chunk files and extract 2D slices.
 
     Steps:
       1. Read header from each PELOOP file to determine grid dimensions (nx, ny, nz).
-      2. Initialize 3D arrays for px, py, pz if first chunk.
+      2. Initialize the (3, nx, ny, nz) px/py/pz array if first chunk (reused, see get_grid_buffer).
       3. Fill arrays using indices and values from each file.
-      4. Optionally write full 3D dataset to PXYZ_FILENAME if WRITE_PXYZ is True.
+      4. Optionally write full 3D dataset if WRITE_PXYZ is True (binary PXYZ_NPY_FILENAME,
+         or ASCII PXYZ_FILENAME if LEGACY_ASCII is True).
       5. Compute 0-based slice indices from user config.
-      6. Extract XY, XZ, YZ slices and write to respective .dat files.
+      6. Extract XY, XZ, YZ slices; optionally write them to .dat files if WRITE_SLICE_DAT is True.
 
     Parameters:
         folder (str): Path to the task directory containing chunk files.
 
     Returns:
-        success (bool): True if all files processed and slices written; False on error.
+        slices (tuple or None): ((px, py) XY slice, (px, pz) XZ slice, (py, pz) YZ slice),
+                                each a (2, n1, n2) array on the native grid; None on error.
+                                Slices are views into a reused buffer and are overwritten
+                                by the next call.
     """
-    pxx = pyy = pzz = None
+    P = None
     nx = ny = nz = None
 
     # Loop through each chunk file
@@ -153,148 +302,236 @@ def slice_data(folder):
         # Check file existence
         if not os.path.isfile(fpath):
             print(f"Missing chunk: {fpath}")
-            return False
+            return None
 
-        # Read data file
+        # Read header only; the data block is parsed in one vectorized call below
         with open(fpath) as f:
             header = f.readline().split()
-            if len(header) < 3:
-                print(f"Bad header in {fpath}")
-                return False
-
-            # Initialize arrays based on first header
-            if pxx is None:
-                nx, ny, nz = map(int, header[:3])
-                pxx = np.zeros((nx, ny, nz))
-                pyy = np.zeros((nx, ny, nz))
-                pzz = np.zeros((nx, ny, nz))
-
-            # Parse data lines into arrays
-            for line in f:
-                pts = line.split()
-                if len(pts) < 6:
-                    continue
-                i1, j1, k1 = map(int, pts[:3])
-                px, py, pz = map(float, pts[3:6])
-                pxx[i1-1, j1-1, k1-1] = px
-                pyy[i1-1, j1-1, k1-1] = py
-                pzz[i1-1, j1-1, k1-1] = pz
-
-    # Optionally write full 3D data
-    if WRITE_PXYZ:
+        if len(header) < 3:
+            print(f"Bad header in {fpath}")
+            return None
+
+        # Initialize arrays based on first header
+        if P is None:
+            nx, ny, nz = map(int, header[:3])
+            P = get_grid_buffer((nx, ny, nz))
+
+        # Parse data lines block by block and scatter values into the 3D arrays
+        try:
+            for data in read_chunk_rows(fpath):
+                # Reject indices outside the header's grid before scattering
+                ijk = data[:, :3]
+                if ijk.size and (ijk.min() < 1 or (ijk.max(axis=0) > (nx, ny, nz)).any()):
+                    raise ValueError("grid index out of range")
+                scatter_chunk(data, P)
+        except ValueError:
+            print(f"Bad data in {fpath}")
+            return None
+
+    # Optionally write full 3D data as a float32 (3, nx, ny, nz) array, or as
+    # ASCII columns i, j, k, px, py, pz when LEGACY_ASCII is set
+    if WRITE_PXYZ and not LEGACY_ASCII:
+        out_all = os.path.join(folder, PXYZ_NPY_FILENAME)
+        np.save(out_all, P.astype(np.float32))
+    elif WRITE_PXYZ:
         out_all = os.path.join(folder, PXYZ_FILENAME)
-        with open(out_all, 'w') as f:
-            f.write(f"{nx} {ny} {nz}\n")
-            for i in range(nx):
-                for j in range(ny):
-                    for k in range(nz):
-                        f.write(f"{i+1} {j+1} {k+1} {pxx[i,j,k]:.5e} {pyy[i,j,k]:.5e} {pzz[i,j,k]:.5e}\n")
+        ijk = np.indices((nx, ny, nz)).reshape(3, -1).T + 1
+        arr = np.column_stack([ijk, P.reshape(3, -1).T])
+        write_columns(out_all, arr, ['%d', '%d', '%d', '%.5e', '%.5e', '%.5e'],
+                      header=f"{nx} {ny} {nz}")
 
     # Compute slice indices (0-based)
     k_xy = XY_SLICE_K - 1
     j_xz = (XZ_J_INDEX - 1) if XZ_J_INDEX else (ny // 2)
     i_yz = (YZ_I_INDEX - 1) if YZ_I_INDEX else (nx // 2)
 
-    # Write XY slice: columns i, j, px, py
-    with open(os.path.join(folder, 'XY.dat'), 'w') as f:
-        for i in range(nx):
-            for j in range(ny):
-                f.write(f"{i+1} {j+1} {pxx[i,j,k_xy]:.5e} {pyy[i,j,k_xy]:.5e}\n")
+    # Extract slices on the native grid as (2, n1, n2) views: (px, py), (px, pz), (py, pz)
+    xy = P[:2, :, :, k_xy]
+    xz = P[::2, :, j_xz, :]
+    yz = P[1:, i_yz, :, :]
+
+    # Optionally write slices: XY columns i, j, px, py; XZ columns i, k, px, pz;
+    # YZ columns j, k, py, pz
+    if WRITE_SLICE_DAT:
+        for plane, (a, b) in (('XY', xy), ('XZ', xz), ('YZ', yz)):
+            I, J = np.meshgrid(np.arange(1, a.shape[0]+1), np.arange(1, a.shape[1]+1),
+                               indexing='ij')
+            arr = np.column_stack([I.ravel(), J.ravel(), a.ravel(), b.ravel()])
+            write_columns(os.path.join(folder, f"{plane}.dat"), arr, ['%d', '%d', '%.5e', '%.5e'])
+
+    return xy, xz, yz
+
+
+def interp_slice(a2d, b2d, ug, vg):
+    """
+    Cubic-spline interpolate two slice components onto a query grid.
+
+    Parameters:
+        a2d, b2d (ndarray): Components on the native grid; element [i, j] lies at
+                            1-based coordinates (i+1, j+1).
+        ug, vg (ndarray): Query coordinates along the first and second grid axes.
 
-    # Write XZ slice: columns i, k, px, pz
-    with open(os.path.join(folder, 'XZ.dat'), 'w') as f:
-        for i in range(nx):
-            for k in range(nz):
-                f.write(f"{i+1} {k+1} {pxx[i,j_xz,k]:.5e} {pzz[i,j_xz,k]:.5e}\n")
+    Returns:
+        ai, bi (ndarray): Interpolated components shaped like ug; NaN outside the grid.
+    """
+    # Map 1-based grid coordinates onto 0-based array indices
+    coords = np.array([ug - 1, vg - 1])
+    outside = ((coords[0] < 0) | (coords[0] > a2d.shape[0] - 1) |
+               (coords[1] < 0) | (coords[1] > a2d.shape[1] - 1))
+    ai = ndimage.map_coordinates(a2d, coords, order=3, mode='nearest')
+    bi = ndimage.map_coordinates(b2d, coords, order=3, mode='nearest')
+    ai[outside] = np.nan
+    bi[outside] = np.nan
+    return ai, bi
+
+
+def arrow_mask(ui, vi):
+    """
+    Boolean mask of the arrows worth drawing: finite (inside the interpolation grid)
+    and longer than QUIVER_MIN_REL_MAG of the longest arrow.
+    """
+    mag = np.hypot(ui, vi)
+    finite = np.isfinite(mag)
+    if not finite.any():
+        return finite
+    return finite & (mag > QUIVER_MIN_REL_MAG * mag[finite].max())
 
-    # Write YZ slice: columns j, k, py, pz
-    with open(os.path.join(folder, 'YZ.dat'), 'w') as f:
-        for j in range(ny):
-            for k in range(nz):
-                f.write(f"{j+1} {k+1} {pyy[i_yz,j,k]:.5e} {pzz[i_yz,j,k]:.5e}\n")
 
-    return True
+def quiver_scale(ax, ui, vi):
+    """
+    Arrow scale and shaft width that quiver would auto-compute for the full grid.
 
+    quiver derives both from the number of arrows passed and their mean length, so
+    they are computed here from the complete interpolated grid (NaN entries count
+    towards N but not the mean, as in quiver) and passed explicitly when only the
+    arrows selected by arrow_mask are drawn.
 
-def plot_xy(folder):
+    Returns:
+        scale (float), width (float): Values for quiver's scale and width (inches).
     """
-    Generate a quiver plot for the XY slice.
+    ax.apply_aspect()
+    span = ax.get_position().width * ax.get_figure().get_figwidth()
+    mag = np.hypot(ui, vi)
+    n = mag.size
+    scale = 1.8 * mag[np.isfinite(mag)].mean() * max(10, np.sqrt(n)) / span
+    width = 0.06 * span / np.clip(np.sqrt(n), 8, 25)
+    return scale, width
+
+
+def get_plot_axes(xlim, ylim):
     """
-    data = np.loadtxt(os.path.join(folder, 'XY.dat'))
-    X, Y, PX, PY = data[:,0], data[:,1], data[:,2], data[:,3]
+    Return this process's shared Figure and Axes, cleared and ready for a quiver plot.
+    The Figure is created on first use so each worker process builds its own.
 
+    Axis limits are fixed up front from the (min, max) data ranges xlim and ylim,
+    padded by the default axes margins, so quiver does not need to autoscale.
+    """
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots()
+    _AX.clear()
+    _AX.set_aspect('equal')
+    _AX.axis('off')
+    xpad = (xlim[1] - xlim[0]) * plt.rcParams['axes.xmargin']
+    ypad = (ylim[1] - ylim[0]) * plt.rcParams['axes.ymargin']
+    _AX.set_xlim(xlim[0] - xpad, xlim[1] + xpad)
+    _AX.set_ylim(ylim[0] - ypad, ylim[1] + ypad)
+    return _FIG, _AX
+
+
+def plot_xy(folder, pxx2d, pyy2d):
+    """
+    Generate a quiver plot for the XY slice given its (nx, ny) px and py arrays.
+    """
     # Create interpolation grid
     xx = np.linspace(XY_X_MIN, XY_X_MAX, XY_INTERP_NUM)
     yy = np.linspace(XY_Y_MIN, XY_Y_MAX, XY_INTERP_NUM2)
     xxg, yyg = np.meshgrid(xx, yy)
 
     # Interpolate vector components onto grid
-    PXi = interpolate.griddata((X, Y), PX, (xxg, yyg), method='cubic')
-    PYi = interpolate.griddata((X, Y), PY, (xxg, yyg), method='cubic')
-
-    # Plot using quiver
-    fig, ax = plt.subplots()
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.quiver(xxg, yyg, PXi, PYi,
-              color=XY_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
-    plt.savefig(os.path.join(folder, f"XY_quiver.{OUTPUT_EXT}"), dpi=XY_DPI,
+    PXi, PYi = interp_slice(pxx2d, pyy2d, xxg, yyg)
+
+    # Plot non-negligible arrows using quiver
+    fig, ax = get_plot_axes((XY_X_MIN, XY_X_MAX), (XY_Y_MIN, XY_Y_MAX))
+    keep = arrow_mask(PXi, PYi)
+    if keep.any():
+        scale, width = quiver_scale(ax, PXi, PYi)
+        ax.quiver(xxg[keep], yyg[keep], PXi[keep], PYi[keep], scale=scale, width=width,
+                  color=XY_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
+    fig.savefig(os.path.join(folder, f"XY_quiver.{OUTPUT_EXT}"), dpi=XY_DPI,
                 bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
 
 
-def plot_xz(folder):
+def plot_xz(folder, pxx2d, pzz2d):
     """
-    Generate a quiver plot for the XZ slice.
+    Generate a quiver plot for the XZ slice given its (nx, nz) px and pz arrays.
     """
-    data = np.loadtxt(os.path.join(folder, 'XZ.dat'))
-    X, Z, PX, PZ = data[:,0], data[:,1], data[:,2] * XZ_SCALE_FACTOR, data[:,3] * XZ_SCALE_FACTOR
-
     # Create interpolation grid
     xx = np.linspace(XZ_X_MIN, XZ_X_MAX, XZ_INTERP_NUM)
     zz = np.linspace(XZ_Z_MIN, XZ_Z_MAX, XZ_INTERP_NUM2)
     xxg, zzg = np.meshgrid(xx, zz)
 
     # Interpolate vector components onto grid
-    PXi = interpolate.griddata((X, Z), PX, (xxg, zzg), method='cubic')
-    PZi = interpolate.griddata((X, Z), PZ, (xxg, zzg), method='cubic')
-
-    # Plot using quiver
-    fig, ax = plt.subplots()
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.quiver(xxg, zzg, PXi, PZi,
-              color=XZ_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
-    plt.savefig(os.path.join(folder, f"XZ_quiver.{OUTPUT_EXT}"), dpi=XZ_DPI,
+    PXi, PZi = interp_slice(pxx2d * XZ_SCALE_FACTOR, pzz2d * XZ_SCALE_FACTOR, xxg, zzg)
+
+    # Plot non-negligible arrows using quiver
+    fig, ax = get_plot_axes((XZ_X_MIN, XZ_X_MAX), (XZ_Z_MIN, XZ_Z_MAX))
+    keep = arrow_mask(PXi, PZi)
+    if keep.any():
+        scale, width = quiver_scale(ax, PXi, PZi)
+        ax.quiver(xxg[keep], zzg[keep], PXi[keep], PZi[keep], scale=scale, width=width,
+                  color=XZ_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
+    fig.savefig(os.path.join(folder, f"XZ_quiver.{OUTPUT_EXT}"), dpi=XZ_DPI,
                 bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
 
 
-def plot_yz(folder):
+def plot_yz(folder, pyy2d, pzz2d):
     """
-    Generate a quiver plot for the YZ slice.
+    Generate a quiver plot for the YZ slice given its (ny, nz) py and pz arrays.
     """
-    data = np.loadtxt(os.path.join(folder, 'YZ.dat'))
-    Y, Z, PY, PZ = data[:,0], data[:,1], data[:,2] * YZ_SCALE_FACTOR, data[:,3] * YZ_SCALE_FACTOR
-
     # Create interpolation grid
     yy = np.linspace(YZ_Y_MIN, YZ_Y_MAX, YZ_INTERP_NUM)
     zz = np.linspace(YZ_Z_MIN, YZ_Z_MAX, YZ_INTERP_NUM2)
     yyg, zzg = np.meshgrid(yy, zz)
 
     # Interpolate vector components onto grid
-    PYi = interpolate.griddata((Y, Z), PY, (yyg, zzg), method='cubic')
-    PZi = interpolate.griddata((Y, Z), PZ, (yyg, zzg), method='cubic')
-
-    # Plot using quiver
-    fig, ax = plt.subplots()
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.quiver(yyg, zzg, PYi, PZi,
-              color=YZ_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
-    plt.savefig(os.path.join(folder, f"YZ_quiver.{OUTPUT_EXT}"), dpi=YZ_DPI,
+    PYi, PZi = interp_slice(pyy2d * YZ_SCALE_FACTOR, pzz2d * YZ_SCALE_FACTOR, yyg, zzg)
+
+    # Plot non-negligible arrows using quiver
+    fig, ax = get_plot_axes((YZ_Y_MIN, YZ_Y_MAX), (YZ_Z_MIN, YZ_Z_MAX))
+    keep = arrow_mask(PYi, PZi)
+    if keep.any():
+        scale, width = quiver_scale(ax, PYi, PZi)
+        ax.quiver(yyg[keep], zzg[keep], PYi[keep], PZi[keep], scale=scale, width=width,
+                  color=YZ_COLOR, units='inches', angles='xy', pivot='mid', headwidth=3.8)
+    fig.savefig(os.path.join(folder, f"YZ_quiver.{OUTPUT_EXT}"), dpi=YZ_DPI,
                 bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
+
+
+def process_task(t):
+    """
+    Slice and plot a single task folder; runs inside a worker process.
+
+    Parameters:
+        t (str): Task folder name under BASE_DIR.
+
+    Returns:
+        t (str or None): The task folder name on success; None if slicing failed.
+    """
+    folder = os.path.join(BASE_DIR, t)
+    print(f"Processing {t}, time step {TIME_STEP}...")
+
+    # Aggregate and slice data; skip if failure
+    slices = slice_data(folder)
+    if slices is None:
+        return None
+    xy, xz, yz = slices
+
+    # Generate quiver plots for each plane
+    plot_xy(folder, *xy)
+    plot_xz(folder, *xz)
+    plot_yz(folder, *yz)
+    return t
 
 
 def main():
@@ -302,27 +539,26 @@ def main():
     Main batch workflow:
       1. Setup summary directories and CSVs.
       2. Discover task directories under BASE_DIR.
-      3. For each, call slice_data, plotting, and summarization.
-      4. Report completion.
+      3. Call process_task for each in a pool of worker processes.
+      4. Summarize finished tasks in the parent so CSV appends are serialized.
+      5. Report completion.
     """
     ensure_summary_setup()
     tasks = sorted(d for d in os.listdir(BASE_DIR)
                    if os.path.isdir(os.path.join(BASE_DIR, d)))
-    for t in tasks:
-        folder = os.path.join(BASE_DIR, t)
-        print(f"Processing {t}, time step {TIME_STEP}...")
-
-        # Slice and write data; skip if failure
-        if not slice_data(folder):
-            continue
-
-        # Generate quiver plots for each plane
-        plot_xy(folder)
-        plot_xz(folder)
-        plot_yz(folder)
+    # Keep summary CSVs open for the whole batch instead of reopening per row
+    csv_handles = {p: open(PLANE_CSV[p], 'a', buffering=1 << 16) for p in PLANE_CSV}
+    try:
+        with multiprocessing.Pool(NUM_WORKERS, maxtasksperchild=MAX_TASKS_PER_CHILD) as pool:
+            for t in pool.imap_unordered(process_task, tasks):
+                if t is None:
+                    continue
 
-        # Summarize plots: copy to summary and record
-        summarize_plots(folder, t)
+                # Summarize plots: link (or copy) into summary and record
+                summarize_plots(os.path.join(BASE_DIR, t), t, csv_handles)
+    finally:
+        for f in csv_handles.values():
+            f.close()
 
     print("Batch processing completed.")
 
@@ -14,9 +14,21 @@ task directories with updated input files, records metadata, and optionally subm
 via SLURM.
 """
 import os
+import shlex
 import shutil
 import itertools
 import csv
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+JOB_SCRIPT      = 'V-3.sh'            # SLURM job script inside the template/task folders
+USE_SLURM_ARRAY = True                # Submit tasks as 'sbatch --array' jobs
+SLURM_MAX_ARRAY_SIZE = 1001           # Cluster's MaxArraySize; each array job gets at most this many tasks
+ARRAY_JOB_PATTERN = 'array_job_%d.sh' # Generated array dispatcher scripts (under tasks/), one per array job
+COPY_WORKERS    = 16                  # Threads used to create task folders concurrently
+TEMPLATE_HARDLINK = False             # Hardlink template files into task folders instead of copying;
+                                      # only safe if the simulation never edits template files in place
 
 
 def parse_input_file(input_path):
@@ -75,43 +87,69 @@ def generate_param_combinations(scan_specs):
             # Inclusive range for integers
             vals = list(range(start, end + (1 if step > 0 else -1), step))
         else:
-            # Floating-point range: accumulate until <= end (with tolerance)
-            v = start
-            while v <= end + 1e-12:
-                vals.append(round(v, 12))
-                v += step
+            # Floating-point range: closed-form count of points up to end (with tolerance),
+            # avoiding round-off accumulated by repeated addition
+            n = max(int(np.floor((end - start) / step + 1 + 1e-9)), 0)
+            vals = (start + step * np.arange(n)).round(12).tolist()
+            # Keep start's own type (e.g. int 1, not 1.0) as the first value, like the
+            # original accumulating loop, since it appears in folder names and inputs
+            if vals:
+                vals[0] = round(start, 12)
         lists.append(vals)
 
-    # Compute Cartesian product of all value lists
+    # Compute Cartesian product of all value lists (itertools keeps each value's
+    # int/float type, which folder names and the input file depend on)
     combos = list(itertools.product(*lists))
     return names, combos
 
 
-def modify_input(lines, param_map, combo, param_names):
+def prepare_template(lines, param_map, param_names):
     """
-    Create a modified copy of the template lines with one set of parameter values applied.
+    Render the template once with placeholders at the fields of the scanned parameters.
+
+    Each affected line is reformatted exactly as a value substitution would reformat
+    it, with the field replaced by '<<name>>'; all other lines are left untouched.
 
     Parameters:
         lines (list of str): Original template file lines.
         param_map (dict): Mapping of parameter names to (line_index, field_index).
-        combo (tuple): Specific combination of values for each parameter.
-        param_names (list): Names of parameters in the same order as combo.
+        param_names (list): Names of the scanned parameters.
 
     Returns:
-        new (list of str): Updated lines with values replaced.
+        segments (list of str): Template lines with placeholders, for modify_input.
     """
-    # Copy lines to avoid mutating the original
-    new = lines.copy()
-    # For each parameter, replace the numeric field at its location
-    for name, val in zip(param_names, combo):
+    segments = lines.copy()
+    for name in param_names:
         ln, pos = param_map[name]
         # Split the line at the comment marker (if exists)
-        before, *rest = new[ln].split('!')
-        nums = before.split()  # Numeric fields before the comment
-        nums[pos] = str(val)   # Set the new value
+        before, *rest = segments[ln].split('!')
+        nums = before.split()           # Numeric fields before the comment
+        nums[pos] = f"<<{name}>>"       # Mark the field for substitution
         # Reattach any trailing comment
         comment = '!' + rest[0] if rest else ''
-        new[ln] = ' '.join(nums) + ' ' + comment
+        segments[ln] = ' '.join(nums) + ' ' + comment
+    return segments
+
+
+def modify_input(segments, param_map, combo, param_names):
+    """
+    Create the input file lines for one set of parameter values.
+
+    Parameters:
+        segments (list of str): Template lines with placeholders from prepare_template.
+        param_map (dict): Mapping of parameter names to (line_index, field_index).
+        combo (tuple): Specific combination of values for each parameter.
+        param_names (list): Names of parameters in the same order as combo.
+
+    Returns:
+        new (list of str): Updated lines with values replaced.
+    """
+    # Shallow copy: untouched lines are shared with the template, only the
+    # placeholder lines are rebuilt
+    new = segments.copy()
+    for name, val in zip(param_names, combo):
+        ln, _ = param_map[name]
+        new[ln] = new[ln].replace(f"<<{name}>>", str(val))
     return new
 
 
@@ -128,6 +166,113 @@ def sanitize(val):
     return str(val)
 
 
+def setup_task(idx, combo, template, input_file, segments, param_map, param_names):
+    """
+    Create one task folder from the template and write its modified input file.
+
+    Parameters:
+        idx (int): 1-based task index.
+        combo (tuple): Parameter values for this task.
+        template (str): Template directory to copy.
+        input_file (str): Name of the input file inside the template.
+        segments, param_map, param_names: As passed to modify_input.
+
+    Returns:
+        row (list): Metadata row [idx, folder_name, *combo] for tasks.csv.
+    """
+    # Build descriptive folder name
+    spec_parts = [f"{n}_{sanitize(v)}" for n, v in zip(param_names, combo)]
+    folder_name = f"task_{idx}_{'_'.join(spec_parts)}"
+    folder = os.path.join('tasks', folder_name)
+
+    # Copy (or hardlink) template and update input
+    if os.path.exists(folder):
+        shutil.rmtree(folder)
+    copy_function = os.link if TEMPLATE_HARDLINK else shutil.copy2
+    shutil.copytree(template, folder, copy_function=copy_function)
+
+    new_lines = modify_input(segments, param_map, combo, param_names)
+    input_path = os.path.join(folder, input_file)
+    if TEMPLATE_HARDLINK:
+        # Break the link so writing does not modify the template's input file
+        os.remove(input_path)
+    with open(input_path, 'w') as f:
+        f.writelines(new_lines)
+
+    return [idx, folder_name] + list(combo)
+
+
+def write_array_job(task_root, folder_names, job_script, part):
+    """
+    Write a dispatcher script for one SLURM array job.
+
+    The dispatcher copies the #SBATCH directives from the template job script (except
+    output/error/working-directory paths, which would collide across array tasks).
+    The task folders are embedded as a bash array, so a later sweep that rewrites
+    tasks/ cannot change which folders a queued job runs. Each array task changes into
+    its folder, points SLURM_SUBMIT_DIR at it (as when sbatch ran inside the folder)
+    and runs the job script there.
+
+    Parameters:
+        task_root (str): Directory holding the task folders; sbatch is run from here.
+        folder_names (list of str): Task folder names in array index order (0-based).
+        job_script (str): Path to the template job script.
+        part (int): Array job number, used in the dispatcher filename.
+
+    Returns:
+        dispatcher (str): Filename of the dispatcher script within task_root.
+    """
+    skip = ('-o', '-e', '-D', '--output', '--error', '--chdir')
+    directives = []
+    with open(job_script) as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 2 or fields[0] != '#SBATCH':
+                continue
+            if not fields[1].split('=')[0].startswith(skip):
+                directives.append(line.rstrip('\n'))
+
+    dispatcher = ARRAY_JOB_PATTERN % part
+    with open(os.path.join(task_root, dispatcher), 'w') as f:
+        f.write('#!/bin/bash\n')
+        f.write('\n'.join(directives + [
+            'FOLDERS=(',
+            *(f'  {shlex.quote(name)}' for name in folder_names),
+            ')',
+            'cd "$SLURM_SUBMIT_DIR" || exit 1',
+            'FOLDER="${FOLDERS[$SLURM_ARRAY_TASK_ID]}"',
+            'cd "$FOLDER" || exit 1',
+            'export SLURM_SUBMIT_DIR="$PWD"',
+            f'bash {os.path.basename(job_script)}',
+        ]) + '\n')
+    return dispatcher
+
+
+def submit_jobs(task_root, folder_names, job_script):
+    """
+    Submit task folders to SLURM, as array jobs of at most SLURM_MAX_ARRAY_SIZE tasks
+    if USE_SLURM_ARRAY is set, otherwise with one sbatch call per task folder.
+
+    Returns:
+        ok (bool): True if every sbatch call succeeded.
+    """
+    try:
+        if USE_SLURM_ARRAY:
+            for part, start in enumerate(range(0, len(folder_names), SLURM_MAX_ARRAY_SIZE), 1):
+                chunk = folder_names[start:start + SLURM_MAX_ARRAY_SIZE]
+                dispatcher = write_array_job(task_root, chunk, job_script, part)
+                subprocess.run(['sbatch', f'--array=0-{len(chunk) - 1}', dispatcher],
+                               cwd=task_root, check=True)
+        else:
+            for name in folder_names:
+                subprocess.run(['sbatch', os.path.basename(job_script)],
+                               cwd=os.path.join(task_root, name), check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error: SLURM submission failed: {e}")
+        return False
+    return True
+
+
 def main():
     """
     Main workflow:
@@ -136,7 +281,7 @@ def main():
       3. Prompt the user to select parameters and define scan ranges.
       4. Generate all combinations, apply symmetry filtering for asub1/asub2.
       5. Preview, confirm, create task directories, write inputs, record metadata.
-      6. Optionally submit each task via SLURM.
+      6. Optionally submit the tasks via SLURM (as one array job by default).
     """
     template = 'origin'
     input_file = 'inputN.in'
@@ -192,7 +337,8 @@ def main():
         i1 = param_names.index('asub1')
         i2 = param_names.index('asub2')
         original = len(combos)
-        combos = [c for c in combos if c[i1] <= c[i2]]
+        mat = np.array(combos, dtype=float).reshape(original, len(param_names))
+        combos = list(itertools.compress(combos, mat[:, i1] <= mat[:, i2]))
         print(f"Applied symmetry filter: {original} -> {len(combos)} combinations.")
 
     total = len(combos)
@@ -211,34 +357,29 @@ def main():
 
     submit = input("Submit jobs via SLURM? [Y/n] ").strip().lower() != 'n'
 
-    # Prepare output directory and CSV
+    # Prepare output directory
     os.makedirs('tasks', exist_ok=True)
     csv_file = 'tasks.csv'
-    with open(csv_file, 'w', newline='') as csvf:
-        writer = csv.writer(csvf)
-        writer.writerow(['id', 'folder'] + param_names)
-
-        for idx, combo in enumerate(combos, 1):
-            # Build descriptive folder name
-            spec_parts = [f"{n}_{sanitize(v)}" for n, v in zip(param_names, combo)]
-            folder_name = f"task_{idx}_{'_'.join(spec_parts)}"
-            folder = os.path.join('tasks', folder_name)
 
-            # Copy template and update input
-            if os.path.exists(folder):
-                shutil.rmtree(folder)
-            shutil.copytree(template, folder)
+    # Render the template once; each task then only fills in its values
+    segments = prepare_template(lines, param_map, param_names)
 
-            new_lines = modify_input(lines, param_map, combo, param_names)
-            with open(os.path.join(folder, input_file), 'w') as f:
-                f.writelines(new_lines)
+    # Create task folders concurrently; rows come back in task order
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        rows = list(ex.map(
+            lambda ic: setup_task(*ic, template, input_file, segments, param_map, param_names),
+            enumerate(combos, 1)))
 
-            # Write metadata
-            writer.writerow([idx, folder_name] + list(combo))
+    # Write metadata CSV in one buffered pass
+    with open(csv_file, 'w', newline='', buffering=1 << 20) as csvf:
+        writer = csv.writer(csvf, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writerow(['id', 'folder'] + param_names)
+        writer.writerows(rows)
 
-            # Optional SLURM submission
-            if submit:
-                os.system(f"cd {folder} && sbatch V-3.sh && cd ..")
+    # Optional SLURM submission
+    if submit and rows:
+        folder_names = [row[1] for row in rows]
+        submit = submit_jobs('tasks', folder_names, os.path.join(template, JOB_SCRIPT))
 
     print(f"Completed {'submission' if submit else 'preparation'} of {total} tasks. Metadata in {csv_file}.")
 